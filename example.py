@@ -28,36 +28,32 @@ def main():
     stream = StreamName(category="Recording", stream_id="b27f9322-7d73-4d98-a605-a731a2c373c6")
     
     try:
-        # Append a RecordingStarted event (using Pythonic snake_case)
+        # Build the events (using Pythonic snake_case)
         started_event = RecordingStarted(
             recording_id="rec-123",
             camera_id="camera-01",
             resolution="1920x1080"
         )
-        
-        print(f"Writing RecordingStarted event with ID: {started_event.id}")
+
+        print(f"RecordingStarted event with ID: {started_event.id}")
         print(f"  Camera: {started_event.camera_id}")  # Pythonic access
         print(f"  Resolution: {started_event.resolution}")
-        
-        client.append_to_stream(stream, started_event)
-        
-        # Simulate some recording time
-        import time
-        time.sleep(1)
-        
-        # Append a RecordingFinished event
+
         finished_event = RecordingFinished(
             recording_id="rec-123",
             duration=120.5,
             file_path="/recordings/rec-123.mp4"
         )
-        
-        print(f"\nWriting RecordingFinished event with ID: {finished_event.id}")
+
+        print(f"\nRecordingFinished event with ID: {finished_event.id}")
         print(f"  Duration: {finished_event.duration} seconds")  # Pythonic access
         print(f"  File: {finished_event.file_path}")
-        
-        client.append_to_stream(stream, finished_event)
-        
+
+        # Append both events atomically with a single round trip.
+        # Prefer append_many over per-event append_to_stream loops:
+        # one gRPC call instead of one per event.
+        client.append_many(stream, [started_event, finished_event])
+
         print(f"\nEvents successfully written to stream: {stream}")
         print("These events are serialized as PascalCase for C# micro-plumberd compatibility!")
         print("\nExample serialized event:")
@@ -1,6 +1,7 @@
 """py-micro-plumberd: A lightweight Python library for writing events to EventStore."""
 
 from .client import EventStoreClient
+from .client_async import AsyncEventStoreClient
 from .command_bus import CommandBus
 from .event import Event
 from .metadata import Metadata
@@ -11,4 +12,12 @@ try:
 except ImportError:
     __version__ = "unknown"
 
-__all__ = ["CommandBus", "Event", "EventStoreClient", "Metadata", "StreamName", "__version__"]
+__all__ = [
+    "AsyncEventStoreClient",
+    "CommandBus",
+    "Event",
+    "EventStoreClient",
+    "Metadata",
+    "StreamName",
+    "__version__",
+]
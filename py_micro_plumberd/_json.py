@@ -0,0 +1,23 @@
+"""Internal JSON encoding helpers for py-micro-plumberd.
+
+Uses orjson (install with the "fast" extra) when available for C-accelerated
+encoding on the append hot path, falling back to the stdlib json module.
+Event payloads are serialized by pydantic-core directly; this helper covers
+the plain-dict payloads such as metadata.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    def dumps(obj: Any) -> bytes:  # noqa: ANN401
+        """Encode an object as UTF-8 JSON bytes."""
+        return orjson.dumps(obj)
+
+except ImportError:
+
+    def dumps(obj: Any) -> bytes:  # noqa: ANN401
+        """Encode an object as UTF-8 JSON bytes."""
+        return json.dumps(obj).encode("utf-8")
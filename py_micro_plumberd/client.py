@@ -1,14 +1,38 @@
 """EventStore client for py-micro-plumberd."""
 
-import json
-from typing import Optional, Union
+from collections.abc import Callable, Sequence
+from typing import Any, Literal, Optional, Union
 
 from esdbclient import EventStoreDBClient, NewEvent, StreamState
 
+from ._json import dumps as _json_dumps
 from .event import Event
 from .metadata import Metadata
 from .stream import StreamName
 
+# Content types NewEvent accepts; MessagePack payloads go out as octet-stream
+_ContentType = Literal["application/json", "application/octet-stream"]
+
+
+def _resolve_codec(codec: str) -> tuple[Callable[[Any], bytes], _ContentType]:
+    """Resolve a codec name to its (encoder, content type) pair.
+
+    Raises:
+        ValueError: If codec is not "json" or "msgpack"
+        ImportError: If codec is "msgpack" and msgspec is not installed
+    """
+    if codec == "json":
+        return _json_dumps, "application/json"
+    if codec == "msgpack":
+        try:
+            import msgspec  # noqa: PLC0415  # optional dependency, imported on demand
+        except ImportError as e:
+            msg = "The msgpack codec requires msgspec: pip install py-micro-plumberd[msgpack]"
+            raise ImportError(msg) from e
+        return msgspec.msgpack.encode, "application/octet-stream"
+    msg = f"Unknown codec: {codec!r} (expected 'json' or 'msgpack')"
+    raise ValueError(msg)
+
 
 class EventStoreClient:
     """Client for appending events to EventStore."""
@@ -19,6 +43,7 @@ class EventStoreClient:
         default_deadline: Optional[float] = None,  # noqa: ARG002
         keep_alive_interval: Optional[int] = None,  # noqa: ARG002
         keep_alive_timeout: Optional[int] = None,  # noqa: ARG002
+        codec: str = "json",
     ) -> None:
         """Initialize EventStore client.
 
@@ -27,11 +52,30 @@ class EventStoreClient:
             default_deadline: Default deadline for operations in seconds
             keep_alive_interval: Keep alive interval in seconds
             keep_alive_timeout: Keep alive timeout in seconds
+            codec: Wire encoding, "json" (default) or "msgpack". MessagePack
+                shrinks payloads considerably but is only readable by
+                consumers that opt in; stock .NET micro-plumberd and
+                EventStore projections expect JSON. Requires msgspec
+                (install with the "msgpack" extra).
+
+        Raises:
+            ValueError: If codec is not "json" or "msgpack"
+            ImportError: If codec is "msgpack" and msgspec is not installed
         """
         # EventStoreDBClient doesn't support these parameters directly in __init__
         # Just pass the URI for now
         self._client = EventStoreDBClient(uri=connection_string)
 
+        self._encode, self._content_type = _resolve_codec(codec)
+        self._codec = codec
+
+    def _encode_event(self, event: Event) -> bytes:
+        """Encode an event payload with the configured codec."""
+        if self._codec == "json":
+            # pydantic-core serializes straight to JSON without building a dict
+            return event.model_dump_json(by_alias=True).encode("utf-8")
+        return self._encode(event.model_dump(by_alias=True, mode="json"))
+
     def append_to_stream(
         self,
         stream: Union[str, StreamName],
@@ -50,8 +94,8 @@ class EventStoreClient:
         Returns:
             The commit position of the appended event
         """
-        # Convert stream to string if needed
-        stream_name = str(stream) if isinstance(stream, StreamName) else stream
+        # StreamName caches its formatted name, so this is a plain attribute read
+        stream_name = stream.name if isinstance(stream, StreamName) else stream
 
         # Get event type name
         event_type = event.__class__.__name__
@@ -60,17 +104,14 @@ class EventStoreClient:
         if metadata is None:
             metadata = Metadata.default()
 
-        enriched_metadata = metadata.enrich(str(event.id).lower())
-
-        # Convert event to data with PascalCase for EventStore
-        event_data = event.model_dump(by_alias=True)
+        enriched_metadata = metadata.enrich(str(event.id))
 
         # Create NewEvent for EventStore
         new_event = NewEvent(
             type=event_type,
-            data=json.dumps(event_data).encode("utf-8"),
-            metadata=json.dumps(enriched_metadata).encode("utf-8"),
-            content_type="application/json",
+            data=self._encode_event(event),
+            metadata=self._encode(enriched_metadata),
+            content_type=self._content_type,
         )
 
         # Determine expected state
@@ -86,6 +127,62 @@ class EventStoreClient:
             current_version=current_position,
         )
 
+    def append_many(
+        self,
+        stream: Union[str, StreamName],
+        events: Sequence[Event],
+        metadata: Optional[Metadata] = None,
+        expected_position: Optional[int] = None,
+    ) -> int:
+        """Append multiple events to a stream in a single round trip.
+
+        All events are written atomically with one gRPC append call, which
+        amortizes the per-call overhead that makes per-event append_to_stream
+        loops slow.
+
+        Args:
+            stream: Stream name or StreamName object
+            events: Events to append, in order
+            metadata: Optional custom metadata applied to every event
+            expected_position: Expected stream position for optimistic concurrency
+
+        Returns:
+            The commit position of the appended events
+        """
+        # StreamName caches its formatted name, so this is a plain attribute read
+        stream_name = stream.name if isinstance(stream, StreamName) else stream
+
+        # Prepare metadata
+        if metadata is None:
+            metadata = Metadata.default()
+
+        # Enrich once per batch: timestamp/hostname are shared, only the
+        # correlation/causation ids differ per event
+        enriched = metadata.enrich_many(str(event.id) for event in events)
+
+        new_events = [
+            NewEvent(
+                type=event.__class__.__name__,
+                data=self._encode_event(event),
+                metadata=self._encode(event_metadata),
+                content_type=self._content_type,
+            )
+            for event, event_metadata in zip(events, enriched)
+        ]
+
+        # Determine expected state
+        if expected_position is not None:
+            current_position: Union[int, StreamState] = expected_position
+        else:
+            current_position = StreamState.ANY
+
+        # Append to stream
+        return self._client.append_to_stream(
+            stream_name=stream_name,
+            events=new_events,
+            current_version=current_position,
+        )
+
     def close(self) -> None:
         """Close the client connection."""
         self._client.close()
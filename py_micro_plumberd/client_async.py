@@ -0,0 +1,185 @@
+"""Asyncio EventStore client for py-micro-plumberd."""
+
+from collections.abc import Sequence
+from typing import Optional, Union
+
+from esdbclient import AsyncEventStoreDBClient, NewEvent, StreamState
+
+from .client import _resolve_codec
+from .event import Event
+from .metadata import Metadata
+from .stream import StreamName
+
+
+class AsyncEventStoreClient:
+    """Asyncio client for appending events to EventStore.
+
+    Mirrors EventStoreClient but performs appends without blocking the event
+    loop, so many appends to different streams can be in flight concurrently
+    (e.g. via asyncio.gather). Appends to the same stream should still be
+    awaited sequentially to preserve event order.
+
+    Example:
+        >>> async with AsyncEventStoreClient("esdb://localhost:2113?tls=false") as client:
+        ...     await client.append_to_stream(stream, event)
+    """
+
+    def __init__(self, connection_string: str, codec: str = "json") -> None:
+        """Initialize the async EventStore client.
+
+        The gRPC connection is established lazily by connect() or on entering
+        the async context manager.
+
+        Args:
+            connection_string: EventStore connection string (e.g., "esdb://localhost:2113?tls=false")
+            codec: Wire encoding, "json" (default) or "msgpack"
+
+        Raises:
+            ValueError: If codec is not "json" or "msgpack"
+            ImportError: If codec is "msgpack" and msgspec is not installed
+        """
+        self._connection_string = connection_string
+        self._client: Optional[AsyncEventStoreDBClient] = None
+
+        self._encode, self._content_type = _resolve_codec(codec)
+        self._codec = codec
+
+    async def connect(self) -> "AsyncEventStoreClient":
+        """Establish the underlying gRPC connection."""
+        if self._client is None:
+            client = AsyncEventStoreDBClient(uri=self._connection_string)
+            await client.connect()
+            self._client = client
+        return self
+
+    def _encode_event(self, event: Event) -> bytes:
+        """Encode an event payload with the configured codec."""
+        if self._codec == "json":
+            # pydantic-core serializes straight to JSON without building a dict
+            return event.model_dump_json(by_alias=True).encode("utf-8")
+        return self._encode(event.model_dump(by_alias=True, mode="json"))
+
+    def _require_client(self) -> AsyncEventStoreDBClient:
+        """Return the connected client or fail with a clear message."""
+        if self._client is None:
+            msg = "Client is not connected; call connect() or use 'async with'"
+            raise RuntimeError(msg)
+        return self._client
+
+    async def append_to_stream(
+        self,
+        stream: Union[str, StreamName],
+        event: Event,
+        metadata: Optional[Metadata] = None,
+        expected_position: Optional[int] = None,
+    ) -> int:
+        """Append an event to a stream without blocking the event loop.
+
+        Args:
+            stream: Stream name or StreamName object
+            event: Event to append
+            metadata: Optional custom metadata
+            expected_position: Expected stream position for optimistic concurrency
+
+        Returns:
+            The commit position of the appended event
+        """
+        client = self._require_client()
+
+        # StreamName caches its formatted name, so this is a plain attribute read
+        stream_name = stream.name if isinstance(stream, StreamName) else stream
+
+        # Prepare metadata
+        if metadata is None:
+            metadata = Metadata.default()
+
+        enriched_metadata = metadata.enrich(str(event.id))
+
+        # Create NewEvent for EventStore
+        new_event = NewEvent(
+            type=event.__class__.__name__,
+            data=self._encode_event(event),
+            metadata=self._encode(enriched_metadata),
+            content_type=self._content_type,
+        )
+
+        # Determine expected state
+        if expected_position is not None:
+            current_position: Union[int, StreamState] = expected_position
+        else:
+            current_position = StreamState.ANY
+
+        # Append to stream
+        return await client.append_to_stream(
+            stream_name=stream_name,
+            events=[new_event],
+            current_version=current_position,
+        )
+
+    async def append_many(
+        self,
+        stream: Union[str, StreamName],
+        events: Sequence[Event],
+        metadata: Optional[Metadata] = None,
+        expected_position: Optional[int] = None,
+    ) -> int:
+        """Append multiple events to a stream in a single round trip.
+
+        Args:
+            stream: Stream name or StreamName object
+            events: Events to append, in order
+            metadata: Optional custom metadata applied to every event
+            expected_position: Expected stream position for optimistic concurrency
+
+        Returns:
+            The commit position of the appended events
+        """
+        client = self._require_client()
+
+        # StreamName caches its formatted name, so this is a plain attribute read
+        stream_name = stream.name if isinstance(stream, StreamName) else stream
+
+        # Prepare metadata
+        if metadata is None:
+            metadata = Metadata.default()
+
+        # Enrich once per batch: timestamp/hostname are shared, only the
+        # correlation/causation ids differ per event
+        enriched = metadata.enrich_many(str(event.id) for event in events)
+
+        new_events = [
+            NewEvent(
+                type=event.__class__.__name__,
+                data=self._encode_event(event),
+                metadata=self._encode(event_metadata),
+                content_type=self._content_type,
+            )
+            for event, event_metadata in zip(events, enriched)
+        ]
+
+        # Determine expected state
+        if expected_position is not None:
+            current_position: Union[int, StreamState] = expected_position
+        else:
+            current_position = StreamState.ANY
+
+        # Append to stream
+        return await client.append_to_stream(
+            stream_name=stream_name,
+            events=new_events,
+            current_version=current_position,
+        )
+
+    async def close(self) -> None:
+        """Close the client connection."""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+    async def __aenter__(self) -> "AsyncEventStoreClient":  # noqa: PYI034
+        """Async context manager entry; connects the client."""
+        return await self.connect()
+
+    async def __aexit__(self, *args: object) -> None:
+        """Async context manager exit."""
+        await self.close()
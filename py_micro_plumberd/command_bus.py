@@ -1,15 +1,15 @@
 """CommandBus implementation for micro-plumberd compatibility."""
 
-import json
-import socket
 from datetime import datetime, timezone
 from typing import Any, Optional, Union
 from uuid import UUID, uuid4
 
 from esdbclient import NewEvent, StreamState
 
+from ._json import dumps as _json_dumps
 from .client import EventStoreClient
 from .event import Event
+from .metadata import Metadata
 
 
 class CommandBus:
@@ -68,7 +68,7 @@ class CommandBus:
         # Build metadata exactly as C# CommandBus does (with same field order)
         metadata = {
             "Created": timestamp,
-            "ClientHostName": socket.gethostname(),
+            "ClientHostName": Metadata.host_name(),
             "$correlationId": command_id,
             "$causationId": command_id,
             "RecipientId": str(recipient_id),  # Where to route
@@ -77,15 +77,17 @@ class CommandBus:
         }
 
         # Serialize command with PascalCase for EventStore
-        if hasattr(command, "model_dump"):
-            # Pydantic v2 model
-            event_data = command.model_dump(by_alias=True, mode="json")
+        if hasattr(command, "model_dump_json"):
+            # Pydantic v2 model: pydantic-core serializes straight to JSON in
+            # declared field order, with no intermediate Python dict
+            data = command.model_dump_json(by_alias=True).encode("utf-8")
         elif hasattr(command, "dict"):
             # Pydantic v1 model (fallback)
-            event_data = command.dict(by_alias=True)
+            data = _json_dumps(command.dict(by_alias=True))
         else:
             # Plain dict or other object
             event_data = command if isinstance(command, dict) else {"data": str(command)}
+            data = _json_dumps(event_data)
 
         # Get event type name
         event_type = command.__class__.__name__ if hasattr(command, "__class__") else "Command"
@@ -93,8 +95,8 @@ class CommandBus:
         # Create EventStore event
         new_event = NewEvent(
             type=event_type,
-            data=json.dumps(event_data).encode("utf-8"),
-            metadata=json.dumps(metadata).encode("utf-8"),
+            data=data,
+            metadata=_json_dumps(metadata),
             content_type="application/json",
         )
 
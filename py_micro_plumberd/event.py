@@ -1,10 +1,26 @@
 """Base Event class for py-micro-plumberd using Pydantic v2."""
 
-from uuid import UUID, uuid4
+import os
+from uuid import UUID
+
+try:
+    # Optional C-extension UUID generator (install with the "fast" extra).
+    # Roughly an order of magnitude faster than the stdlib on the per-event
+    # hot path driven by append_to_stream; returns stdlib-compatible UUIDs.
+    from uuid_utils.compat import uuid4
+except ImportError:
+    from uuid import uuid4
+
+from functools import lru_cache
 
 from pydantic import BaseModel, ConfigDict, Field, field_serializer
 from pydantic.alias_generators import to_pascal
 
+# Field names repeat across event classes (id, recording_id, ...), so memoize
+# the snake_case -> PascalCase conversion globally; repeated conversions become
+# a dict lookup instead of a split/title/join pass.
+_to_pascal_cached = lru_cache(maxsize=None)(to_pascal)
+
 
 class Event(BaseModel):
     """Base class for all events using Pydantic v2.
@@ -36,7 +52,7 @@ class Event(BaseModel):
 
     model_config = ConfigDict(
         # Convert snake_case fields to PascalCase for serialization
-        alias_generator=to_pascal,
+        alias_generator=_to_pascal_cached,
         # Allow both snake_case and PascalCase when deserializing
         populate_by_name=True,
         # Use Enum values for serialization
@@ -47,7 +63,36 @@ class Event(BaseModel):
 
     id: UUID = Field(default_factory=uuid4)
 
+    @staticmethod
+    def preallocate_ids(count: int) -> list[UUID]:
+        """Generate event ids in bulk with a single entropy read.
+
+        Pulls all the randomness with one os.urandom call instead of one per
+        event, which amortizes the syscall overhead when building large
+        batches for append_many. Feed the result to the id field:
+        ``Event(id=ids[i], ...)``.
+
+        Args:
+            count: Number of ids to generate
+
+        Returns:
+            List of random (version 4) UUIDs
+        """
+        raw = os.urandom(16 * count)
+        ids = []
+        for offset in range(0, 16 * count, 16):
+            block = bytearray(raw[offset : offset + 16])
+            # Set the RFC 4122 version (4) and variant bits
+            block[6] = (block[6] & 0x0F) | 0x40
+            block[8] = (block[8] & 0x3F) | 0x80
+            ids.append(UUID(bytes=bytes(block)))
+        return ids
+
     @field_serializer("id")
     def serialize_id(self, value: UUID) -> str:
-        """Serialize UUID as lowercase string with dashes for EventStore compatibility."""
-        return str(value).lower()
+        """Serialize UUID as lowercase string with dashes for EventStore compatibility.
+
+        str(UUID) is already lowercase hex per RFC 4122, so no extra lowercasing
+        is needed.
+        """
+        return str(value)
@@ -1,9 +1,14 @@
 """Metadata handling for py-micro-plumberd."""
 
 import socket
+from collections.abc import Iterable
 from datetime import datetime, timezone
 from typing import Any
 
+# Resolved once at import: gethostname() is a syscall per call and the
+# hostname rarely changes. Metadata.refresh_host() re-reads it on demand.
+_client_host_name = socket.gethostname()
+
 
 class Metadata:
     """Event metadata container with automatic enrichment."""
@@ -25,17 +30,16 @@ class Metadata:
         Returns:
             Complete metadata dictionary with standard fields
         """
-        # Get current timestamp in ISO 8601 format with timezone
-        now = datetime.now(timezone.utc).astimezone()
-        created = now.isoformat()
-
-        # Get hostname
-        hostname = socket.gethostname()
+        # Get current timestamp in ISO 8601 format with timezone.
+        # datetime.now(tz) is the C-accelerated path; skipping the astimezone()
+        # local-zone conversion avoids a tz lookup per event and keeps
+        # timestamps uniformly in UTC (+00:00).
+        created = datetime.now(timezone.utc).isoformat()
 
         # Build metadata dictionary
         metadata = {
             "Created": created,
-            "ClientHostName": hostname,
+            "ClientHostName": _client_host_name,
             "$correlationId": event_id,
             "$causationId": event_id,
         }
@@ -45,6 +49,51 @@ class Metadata:
 
         return metadata
 
+    def enrich_many(self, event_ids: Iterable[str]) -> list[dict[str, Any]]:
+        """Enrich metadata for a batch of events sharing one timestamp.
+
+        Computes the timestamp, hostname and custom fields once and reuses
+        them across the batch, so per-event work is reduced to setting the
+        correlation/causation ids. Used by batch appends.
+
+        Args:
+            event_ids: The unique identifier of each event, in batch order
+
+        Returns:
+            One complete metadata dictionary per event id
+        """
+        base = self.enrich("")
+
+        enriched = []
+        for event_id in event_ids:
+            metadata = base.copy()
+            # Don't clobber ids the custom metadata pinned explicitly
+            if "$correlationId" not in self._data:
+                metadata["$correlationId"] = event_id
+            if "$causationId" not in self._data:
+                metadata["$causationId"] = event_id
+            enriched.append(metadata)
+
+        return enriched
+
+    @staticmethod
+    def host_name() -> str:
+        """Return the hostname cached at module import."""
+        return _client_host_name
+
+    @staticmethod
+    def refresh_host() -> str:
+        """Re-read the hostname cached at import.
+
+        For long-running processes that need to pick up a hostname change.
+
+        Returns:
+            The freshly resolved hostname
+        """
+        global _client_host_name  # noqa: PLW0603
+        _client_host_name = socket.gethostname()
+        return _client_host_name
+
     @staticmethod
     def default() -> "Metadata":
         """Create default empty metadata."""
@@ -4,6 +4,8 @@
 class StreamName:
     """Represents an EventStore stream name following the {Category}-{StreamId} convention."""
 
+    __slots__ = ("_name", "category", "stream_id")
+
     def __init__(self, category: str, stream_id: str) -> None:
         """Initialize a stream name.
 
@@ -20,15 +22,36 @@ class StreamName:
 
         self.category = category
         self.stream_id = stream_id
+        # Format once; appends in tight loops reuse the cached string
+        self._name = f"{category}-{stream_id}"
+
+    @property
+    def name(self) -> str:
+        """The formatted stream name, cached at construction."""
+        return self._name
 
     def __str__(self) -> str:
         """Return the formatted stream name."""
-        return f"{self.category}-{self.stream_id}"
+        return self._name
 
     def __repr__(self) -> str:
         """Return string representation for debugging."""
         return f"StreamName(category='{self.category}', stream_id='{self.stream_id}')"
 
+    def __eq__(self, other: object) -> bool:
+        """Compare stream names by their formatted value."""
+        if isinstance(other, StreamName):
+            return self._name == other._name
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """Hash by the formatted name so StreamName can key per-stream caches.
+
+        CPython caches a str's hash after the first computation, so repeated
+        probes reuse it.
+        """
+        return hash(self._name)
+
     @classmethod
     def parse(cls, stream_name: str) -> "StreamName":
         """Parse a stream name string into a StreamName object.
@@ -8,6 +8,7 @@ import pytest
 
 from py_micro_plumberd.command_bus import CommandBus
 from py_micro_plumberd.event import Event
+from py_micro_plumberd.metadata import Metadata
 
 
 class TestCommand(Event):
@@ -87,20 +88,24 @@ class TestCommandBus:
         # Verify the command was sent
         mock_client._client.append_to_stream.assert_called_once()  # noqa: SLF001
 
-    @patch("socket.gethostname")
     async def test_metadata_format(
         self,
-        mock_hostname: MagicMock,
         command_bus: CommandBus,
         mock_client: MagicMock,
     ) -> None:
         """Test that metadata is formatted correctly for C# compatibility."""
-        mock_hostname.return_value = "test-host"
-
-        recipient_id = "ui-session-789"
-        command = TestCommand(title="Meta Test", priority=3)
-
-        await command_bus.send_async(recipient_id, command)
+        # The hostname is cached at import, so repoint the cache, not the syscall
+        with patch("socket.gethostname", return_value="test-host"):
+            Metadata.refresh_host()
+
+        try:
+            recipient_id = "ui-session-789"
+            command = TestCommand(title="Meta Test", priority=3)
+
+            await command_bus.send_async(recipient_id, command)
+        finally:
+            # Restore the real hostname for other tests
+            Metadata.refresh_host()
 
         # Get the metadata from the call
         call_args = mock_client._client.append_to_stream.call_args  # noqa: SLF001
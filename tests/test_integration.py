@@ -9,7 +9,7 @@ from typing import Optional
 import pytest
 from esdbclient import EventStoreDBClient
 
-from py_micro_plumberd import Event, EventStoreClient, Metadata, StreamName
+from py_micro_plumberd import AsyncEventStoreClient, Event, EventStoreClient, Metadata, StreamName
 
 
 # Test events using Pydantic v2 style
@@ -186,6 +186,43 @@ class TestEventStoreIntegration:
         finally:
             esdb_client.close()
 
+    @pytest.mark.skipif(
+        os.getenv("SKIP_INTEGRATION_TESTS", "true").lower() == "true",
+        reason="Integration tests require EventStore",
+    )
+    def test_append_many(self, client: EventStoreClient, unique_stream: StreamName) -> None:
+        """Test appending multiple events in a single round trip."""
+        events = [
+            TaskCreated(title="Implement feature", description="Add new feature X"),
+            TaskCompleted(completed_by="developer@example.com"),
+        ]
+
+        # Append both events with one call
+        position = client.append_many(stream=unique_stream, events=events)
+
+        assert position is not None
+
+        # Read back to verify order and content
+        stream_name = str(unique_stream)
+        esdb_client = EventStoreDBClient(
+            uri=os.getenv("EVENTSTORE_URL", "esdb://localhost:2113?tls=false"),
+        )
+
+        try:
+            recorded = list(esdb_client.read_stream(stream_name))
+            assert len(recorded) == len(events)
+            assert recorded[0].type == "TaskCreated"
+            assert recorded[1].type == "TaskCompleted"
+
+            data = json.loads(recorded[0].data)
+            assert data["Title"] == "Implement feature"
+
+            # Each event keeps its own correlation metadata
+            metadata_dict = json.loads(recorded[1].metadata)
+            assert metadata_dict["$causationId"] == str(events[1].id)
+        finally:
+            esdb_client.close()
+
     @pytest.mark.skipif(
         os.getenv("SKIP_INTEGRATION_TESTS", "true").lower() == "true",
         reason="Integration tests require EventStore",
@@ -237,6 +274,53 @@ class TestEventStoreIntegration:
             esdb_client.close()
 
 
+class TestAsyncEventStoreIntegration:
+    """Test async EventStore integration."""
+
+    @pytest.mark.skipif(
+        os.getenv("SKIP_INTEGRATION_TESTS", "true").lower() == "true",
+        reason="Integration tests require EventStore",
+    )
+    async def test_async_append_event(
+        self,
+        eventstore_url: str,
+        unique_stream: StreamName,
+    ) -> None:
+        """Test appending events through the async client."""
+        event = RecordingFinished(
+            recording_id="rec-async",
+            duration=60.0,
+            file_path="/recordings/rec-async.mp4",
+        )
+
+        async with AsyncEventStoreClient(eventstore_url) as client:
+            position = await client.append_to_stream(stream=unique_stream, event=event)
+            assert position is not None
+
+            batch_position = await client.append_many(
+                stream=unique_stream,
+                events=[
+                    TaskCreated(title="Async task", description="Created concurrently"),
+                    TaskCompleted(completed_by="developer@example.com"),
+                ],
+            )
+            assert batch_position is not None
+
+        # Read back to verify
+        stream_name = str(unique_stream)
+        esdb_client = EventStoreDBClient(uri=eventstore_url)
+        try:
+            expected_count = 3
+            events = list(esdb_client.read_stream(stream_name))
+            assert len(events) == expected_count
+            assert events[0].type == "RecordingFinished"
+
+            data = json.loads(events[0].data)
+            assert data["RecordingId"] == "rec-async"
+        finally:
+            esdb_client.close()
+
+
 class TestDeserialization:
     """Test deserialization from EventStore format."""
 
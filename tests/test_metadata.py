@@ -1,5 +1,7 @@
 """Unit tests for Metadata class."""
 
+from unittest.mock import patch
+
 from py_micro_plumberd.metadata import Metadata
 
 
@@ -62,6 +64,22 @@ class TestMetadata:
         assert "Created" in result
         assert "ClientHostName" in result
 
+    def test_metadata_hostname_cached_and_refreshable(self) -> None:
+        """Test that the hostname is cached at import and refresh_host re-reads it."""
+        try:
+            with patch("socket.gethostname", return_value="renamed-host"):
+                # enrich uses the cached value, not a fresh syscall
+                result = Metadata().enrich("event-host")
+                assert result["ClientHostName"] != "renamed-host"
+
+                # refresh_host picks up the change
+                assert Metadata.refresh_host() == "renamed-host"
+                result = Metadata().enrich("event-host")
+                assert result["ClientHostName"] == "renamed-host"
+        finally:
+            # Restore the real hostname for other tests
+            Metadata.refresh_host()
+
     def test_metadata_timestamp_format(self) -> None:
         """Test that timestamp is in ISO format."""
         metadata = Metadata()
@@ -72,6 +90,33 @@ class TestMetadata:
         assert "T" in created  # ISO format has T separator
         assert "+" in created or "-" in created or "Z" in created  # Has timezone
 
+    def test_metadata_enrich_many(self) -> None:
+        """Test batch enrichment shares common fields across events."""
+        metadata = Metadata(static_field="static_value")
+        event_ids = ["event-1", "event-2", "event-3"]
+        results = metadata.enrich_many(event_ids)
+
+        assert len(results) == len(event_ids)
+
+        # Per-event correlation/causation ids
+        for result, event_id in zip(results, event_ids):
+            assert result["$correlationId"] == event_id
+            assert result["$causationId"] == event_id
+            assert result["static_field"] == "static_value"
+
+        # Common fields are computed once for the whole batch
+        assert results[0]["Created"] == results[1]["Created"] == results[2]["Created"]
+        assert results[0]["ClientHostName"] == results[1]["ClientHostName"]
+
+    def test_metadata_enrich_many_custom_ids_preserved(self) -> None:
+        """Test that explicitly pinned correlation ids survive batch enrichment."""
+        metadata = Metadata(**{"$correlationId": "custom-corr"})
+        results = metadata.enrich_many(["event-1", "event-2"])
+
+        for result, event_id in zip(results, ["event-1", "event-2"]):
+            assert result["$correlationId"] == "custom-corr"
+            assert result["$causationId"] == event_id
+
     def test_metadata_multiple_enrichments(self) -> None:
         """Test enriching the same metadata multiple times."""
         metadata = Metadata(static_field="static_value")
@@ -19,12 +19,38 @@ class TestStreamName:
         stream = StreamName(category="User", stream_id="abc-123")
         assert str(stream) == "User-abc-123"
 
+    def test_stream_name_name_attribute(self) -> None:
+        """Test that the cached name attribute matches str()."""
+        stream = StreamName(category="Recording", stream_id="12345")
+        assert stream.name == "Recording-12345"
+        assert stream.name == str(stream)
+
     def test_stream_name_repr(self) -> None:
         """Test StreamName repr for debugging."""
         stream = StreamName(category="Order", stream_id="xyz-789")
         expected = "StreamName(category='Order', stream_id='xyz-789')"
         assert repr(stream) == expected
 
+    def test_stream_name_equality(self) -> None:
+        """Test that equal stream names compare equal."""
+        first = StreamName(category="Recording", stream_id="12345")
+        second = StreamName(category="Recording", stream_id="12345")
+        other = StreamName(category="Recording", stream_id="67890")
+
+        assert first == second
+        assert first != other
+        assert first != "Recording-12345"  # Not equal to plain strings
+
+    def test_stream_name_usable_as_dict_key(self) -> None:
+        """Test that StreamName hashes consistently for per-stream caches."""
+        first = StreamName(category="Recording", stream_id="12345")
+        second = StreamName(category="Recording", stream_id="12345")
+
+        cached_value = 7
+        cache = {first: cached_value}
+        assert cache[second] == cached_value
+        assert len({first, second}) == 1
+
     def test_empty_category_raises_error(self) -> None:
         """Test that empty category raises ValueError."""
         with pytest.raises(ValueError, match="Category cannot be empty"):